@@ -0,0 +1,439 @@
+# Generated by "python pe_kernel_generator.py 32", do not edit.
+import numpy as np
+from numba import njit
+
+c1 = np.float32(0.9807852506637573)
+s1 = np.float32(-0.19509032368659973)
+c2 = np.float32(0.9238795042037964)
+s2 = np.float32(-0.3826834261417389)
+c3 = np.float32(0.8314695954322815)
+s3 = np.float32(-0.5555702447891235)
+c4 = np.float32(0.7071067690849304)
+s4 = np.float32(-0.7071067690849304)
+c5 = np.float32(0.5555702447891235)
+s5 = np.float32(-0.8314695954322815)
+c6 = np.float32(0.3826834261417389)
+s6 = np.float32(-0.9238795042037964)
+c7 = np.float32(0.19509032368659973)
+s7 = np.float32(-0.9807852506637573)
+c9 = np.float32(-0.19509032368659973)
+s9 = np.float32(-0.9807852506637573)
+c10 = np.float32(-0.3826834261417389)
+s10 = np.float32(-0.9238795042037964)
+c11 = np.float32(-0.5555702447891235)
+s11 = np.float32(-0.8314695954322815)
+c12 = np.float32(-0.7071067690849304)
+s12 = np.float32(-0.7071067690849304)
+c13 = np.float32(-0.8314695954322815)
+s13 = np.float32(-0.5555702447891235)
+c14 = np.float32(-0.9238795042037964)
+s14 = np.float32(-0.3826834261417389)
+c15 = np.float32(-0.9807852506637573)
+s15 = np.float32(-0.19509032368659973)
+
+
+@njit('float32[:, ::1](float32[:, :, ::1], float32[:, :, ::1])', cache=True, fastmath=True, nogil=True)
+def pe_array_kernel_32(x, y):
+    fft_abs = np.empty((x.shape[0], 16), np.float32)
+    for p in range(x.shape[0]):
+        r0 = x[p, 0, 0] * y[p, 0, 0] + x[p, 1, 0] * y[p, 1, 0]
+        i0 = x[p, 1, 0] * y[p, 0, 0] - x[p, 0, 0] * y[p, 1, 0]
+        r16 = x[p, 0, 1] * y[p, 0, 1] + x[p, 1, 1] * y[p, 1, 1]
+        i16 = x[p, 1, 1] * y[p, 0, 1] - x[p, 0, 1] * y[p, 1, 1]
+        r8 = x[p, 0, 2] * y[p, 0, 2] + x[p, 1, 2] * y[p, 1, 2]
+        i8 = x[p, 1, 2] * y[p, 0, 2] - x[p, 0, 2] * y[p, 1, 2]
+        r24 = x[p, 0, 3] * y[p, 0, 3] + x[p, 1, 3] * y[p, 1, 3]
+        i24 = x[p, 1, 3] * y[p, 0, 3] - x[p, 0, 3] * y[p, 1, 3]
+        r4 = x[p, 0, 4] * y[p, 0, 4] + x[p, 1, 4] * y[p, 1, 4]
+        i4 = x[p, 1, 4] * y[p, 0, 4] - x[p, 0, 4] * y[p, 1, 4]
+        r20 = x[p, 0, 5] * y[p, 0, 5] + x[p, 1, 5] * y[p, 1, 5]
+        i20 = x[p, 1, 5] * y[p, 0, 5] - x[p, 0, 5] * y[p, 1, 5]
+        r12 = x[p, 0, 6] * y[p, 0, 6] + x[p, 1, 6] * y[p, 1, 6]
+        i12 = x[p, 1, 6] * y[p, 0, 6] - x[p, 0, 6] * y[p, 1, 6]
+        r28 = x[p, 0, 7] * y[p, 0, 7] + x[p, 1, 7] * y[p, 1, 7]
+        i28 = x[p, 1, 7] * y[p, 0, 7] - x[p, 0, 7] * y[p, 1, 7]
+        r2 = x[p, 0, 8] * y[p, 0, 8] + x[p, 1, 8] * y[p, 1, 8]
+        i2 = x[p, 1, 8] * y[p, 0, 8] - x[p, 0, 8] * y[p, 1, 8]
+        r18 = x[p, 0, 9] * y[p, 0, 9] + x[p, 1, 9] * y[p, 1, 9]
+        i18 = x[p, 1, 9] * y[p, 0, 9] - x[p, 0, 9] * y[p, 1, 9]
+        r10 = x[p, 0, 10] * y[p, 0, 10] + x[p, 1, 10] * y[p, 1, 10]
+        i10 = x[p, 1, 10] * y[p, 0, 10] - x[p, 0, 10] * y[p, 1, 10]
+        r26 = x[p, 0, 11] * y[p, 0, 11] + x[p, 1, 11] * y[p, 1, 11]
+        i26 = x[p, 1, 11] * y[p, 0, 11] - x[p, 0, 11] * y[p, 1, 11]
+        r6 = x[p, 0, 12] * y[p, 0, 12] + x[p, 1, 12] * y[p, 1, 12]
+        i6 = x[p, 1, 12] * y[p, 0, 12] - x[p, 0, 12] * y[p, 1, 12]
+        r22 = x[p, 0, 13] * y[p, 0, 13] + x[p, 1, 13] * y[p, 1, 13]
+        i22 = x[p, 1, 13] * y[p, 0, 13] - x[p, 0, 13] * y[p, 1, 13]
+        r14 = x[p, 0, 14] * y[p, 0, 14] + x[p, 1, 14] * y[p, 1, 14]
+        i14 = x[p, 1, 14] * y[p, 0, 14] - x[p, 0, 14] * y[p, 1, 14]
+        r30 = x[p, 0, 15] * y[p, 0, 15] + x[p, 1, 15] * y[p, 1, 15]
+        i30 = x[p, 1, 15] * y[p, 0, 15] - x[p, 0, 15] * y[p, 1, 15]
+        r1 = x[p, 0, 16] * y[p, 0, 16] + x[p, 1, 16] * y[p, 1, 16]
+        i1 = x[p, 1, 16] * y[p, 0, 16] - x[p, 0, 16] * y[p, 1, 16]
+        r17 = x[p, 0, 17] * y[p, 0, 17] + x[p, 1, 17] * y[p, 1, 17]
+        i17 = x[p, 1, 17] * y[p, 0, 17] - x[p, 0, 17] * y[p, 1, 17]
+        r9 = x[p, 0, 18] * y[p, 0, 18] + x[p, 1, 18] * y[p, 1, 18]
+        i9 = x[p, 1, 18] * y[p, 0, 18] - x[p, 0, 18] * y[p, 1, 18]
+        r25 = x[p, 0, 19] * y[p, 0, 19] + x[p, 1, 19] * y[p, 1, 19]
+        i25 = x[p, 1, 19] * y[p, 0, 19] - x[p, 0, 19] * y[p, 1, 19]
+        r5 = x[p, 0, 20] * y[p, 0, 20] + x[p, 1, 20] * y[p, 1, 20]
+        i5 = x[p, 1, 20] * y[p, 0, 20] - x[p, 0, 20] * y[p, 1, 20]
+        r21 = x[p, 0, 21] * y[p, 0, 21] + x[p, 1, 21] * y[p, 1, 21]
+        i21 = x[p, 1, 21] * y[p, 0, 21] - x[p, 0, 21] * y[p, 1, 21]
+        r13 = x[p, 0, 22] * y[p, 0, 22] + x[p, 1, 22] * y[p, 1, 22]
+        i13 = x[p, 1, 22] * y[p, 0, 22] - x[p, 0, 22] * y[p, 1, 22]
+        r29 = x[p, 0, 23] * y[p, 0, 23] + x[p, 1, 23] * y[p, 1, 23]
+        i29 = x[p, 1, 23] * y[p, 0, 23] - x[p, 0, 23] * y[p, 1, 23]
+        r3 = x[p, 0, 24] * y[p, 0, 24] + x[p, 1, 24] * y[p, 1, 24]
+        i3 = x[p, 1, 24] * y[p, 0, 24] - x[p, 0, 24] * y[p, 1, 24]
+        r19 = x[p, 0, 25] * y[p, 0, 25] + x[p, 1, 25] * y[p, 1, 25]
+        i19 = x[p, 1, 25] * y[p, 0, 25] - x[p, 0, 25] * y[p, 1, 25]
+        r11 = x[p, 0, 26] * y[p, 0, 26] + x[p, 1, 26] * y[p, 1, 26]
+        i11 = x[p, 1, 26] * y[p, 0, 26] - x[p, 0, 26] * y[p, 1, 26]
+        r27 = x[p, 0, 27] * y[p, 0, 27] + x[p, 1, 27] * y[p, 1, 27]
+        i27 = x[p, 1, 27] * y[p, 0, 27] - x[p, 0, 27] * y[p, 1, 27]
+        r7 = x[p, 0, 28] * y[p, 0, 28] + x[p, 1, 28] * y[p, 1, 28]
+        i7 = x[p, 1, 28] * y[p, 0, 28] - x[p, 0, 28] * y[p, 1, 28]
+        r23 = x[p, 0, 29] * y[p, 0, 29] + x[p, 1, 29] * y[p, 1, 29]
+        i23 = x[p, 1, 29] * y[p, 0, 29] - x[p, 0, 29] * y[p, 1, 29]
+        r15 = x[p, 0, 30] * y[p, 0, 30] + x[p, 1, 30] * y[p, 1, 30]
+        i15 = x[p, 1, 30] * y[p, 0, 30] - x[p, 0, 30] * y[p, 1, 30]
+        r31 = x[p, 0, 31] * y[p, 0, 31] + x[p, 1, 31] * y[p, 1, 31]
+        i31 = x[p, 1, 31] * y[p, 0, 31] - x[p, 0, 31] * y[p, 1, 31]
+        tr = r1
+        ti = i1
+        r0, r1 = r0 + tr, r0 - tr
+        i0, i1 = i0 + ti, i0 - ti
+        tr = r3
+        ti = i3
+        r2, r3 = r2 + tr, r2 - tr
+        i2, i3 = i2 + ti, i2 - ti
+        tr = r5
+        ti = i5
+        r4, r5 = r4 + tr, r4 - tr
+        i4, i5 = i4 + ti, i4 - ti
+        tr = r7
+        ti = i7
+        r6, r7 = r6 + tr, r6 - tr
+        i6, i7 = i6 + ti, i6 - ti
+        tr = r9
+        ti = i9
+        r8, r9 = r8 + tr, r8 - tr
+        i8, i9 = i8 + ti, i8 - ti
+        tr = r11
+        ti = i11
+        r10, r11 = r10 + tr, r10 - tr
+        i10, i11 = i10 + ti, i10 - ti
+        tr = r13
+        ti = i13
+        r12, r13 = r12 + tr, r12 - tr
+        i12, i13 = i12 + ti, i12 - ti
+        tr = r15
+        ti = i15
+        r14, r15 = r14 + tr, r14 - tr
+        i14, i15 = i14 + ti, i14 - ti
+        tr = r17
+        ti = i17
+        r16, r17 = r16 + tr, r16 - tr
+        i16, i17 = i16 + ti, i16 - ti
+        tr = r19
+        ti = i19
+        r18, r19 = r18 + tr, r18 - tr
+        i18, i19 = i18 + ti, i18 - ti
+        tr = r21
+        ti = i21
+        r20, r21 = r20 + tr, r20 - tr
+        i20, i21 = i20 + ti, i20 - ti
+        tr = r23
+        ti = i23
+        r22, r23 = r22 + tr, r22 - tr
+        i22, i23 = i22 + ti, i22 - ti
+        tr = r25
+        ti = i25
+        r24, r25 = r24 + tr, r24 - tr
+        i24, i25 = i24 + ti, i24 - ti
+        tr = r27
+        ti = i27
+        r26, r27 = r26 + tr, r26 - tr
+        i26, i27 = i26 + ti, i26 - ti
+        tr = r29
+        ti = i29
+        r28, r29 = r28 + tr, r28 - tr
+        i28, i29 = i28 + ti, i28 - ti
+        tr = r31
+        ti = i31
+        r30, r31 = r30 + tr, r30 - tr
+        i30, i31 = i30 + ti, i30 - ti
+        tr = r2
+        ti = i2
+        r0, r2 = r0 + tr, r0 - tr
+        i0, i2 = i0 + ti, i0 - ti
+        tr = i3
+        ti = -r3
+        r1, r3 = r1 + tr, r1 - tr
+        i1, i3 = i1 + ti, i1 - ti
+        tr = r6
+        ti = i6
+        r4, r6 = r4 + tr, r4 - tr
+        i4, i6 = i4 + ti, i4 - ti
+        tr = i7
+        ti = -r7
+        r5, r7 = r5 + tr, r5 - tr
+        i5, i7 = i5 + ti, i5 - ti
+        tr = r10
+        ti = i10
+        r8, r10 = r8 + tr, r8 - tr
+        i8, i10 = i8 + ti, i8 - ti
+        tr = i11
+        ti = -r11
+        r9, r11 = r9 + tr, r9 - tr
+        i9, i11 = i9 + ti, i9 - ti
+        tr = r14
+        ti = i14
+        r12, r14 = r12 + tr, r12 - tr
+        i12, i14 = i12 + ti, i12 - ti
+        tr = i15
+        ti = -r15
+        r13, r15 = r13 + tr, r13 - tr
+        i13, i15 = i13 + ti, i13 - ti
+        tr = r18
+        ti = i18
+        r16, r18 = r16 + tr, r16 - tr
+        i16, i18 = i16 + ti, i16 - ti
+        tr = i19
+        ti = -r19
+        r17, r19 = r17 + tr, r17 - tr
+        i17, i19 = i17 + ti, i17 - ti
+        tr = r22
+        ti = i22
+        r20, r22 = r20 + tr, r20 - tr
+        i20, i22 = i20 + ti, i20 - ti
+        tr = i23
+        ti = -r23
+        r21, r23 = r21 + tr, r21 - tr
+        i21, i23 = i21 + ti, i21 - ti
+        tr = r26
+        ti = i26
+        r24, r26 = r24 + tr, r24 - tr
+        i24, i26 = i24 + ti, i24 - ti
+        tr = i27
+        ti = -r27
+        r25, r27 = r25 + tr, r25 - tr
+        i25, i27 = i25 + ti, i25 - ti
+        tr = r30
+        ti = i30
+        r28, r30 = r28 + tr, r28 - tr
+        i28, i30 = i28 + ti, i28 - ti
+        tr = i31
+        ti = -r31
+        r29, r31 = r29 + tr, r29 - tr
+        i29, i31 = i29 + ti, i29 - ti
+        tr = r4
+        ti = i4
+        r0, r4 = r0 + tr, r0 - tr
+        i0, i4 = i0 + ti, i0 - ti
+        tr = c4 * r5 - s4 * i5
+        ti = c4 * i5 + s4 * r5
+        r1, r5 = r1 + tr, r1 - tr
+        i1, i5 = i1 + ti, i1 - ti
+        tr = i6
+        ti = -r6
+        r2, r6 = r2 + tr, r2 - tr
+        i2, i6 = i2 + ti, i2 - ti
+        tr = c12 * r7 - s12 * i7
+        ti = c12 * i7 + s12 * r7
+        r3, r7 = r3 + tr, r3 - tr
+        i3, i7 = i3 + ti, i3 - ti
+        tr = r12
+        ti = i12
+        r8, r12 = r8 + tr, r8 - tr
+        i8, i12 = i8 + ti, i8 - ti
+        tr = c4 * r13 - s4 * i13
+        ti = c4 * i13 + s4 * r13
+        r9, r13 = r9 + tr, r9 - tr
+        i9, i13 = i9 + ti, i9 - ti
+        tr = i14
+        ti = -r14
+        r10, r14 = r10 + tr, r10 - tr
+        i10, i14 = i10 + ti, i10 - ti
+        tr = c12 * r15 - s12 * i15
+        ti = c12 * i15 + s12 * r15
+        r11, r15 = r11 + tr, r11 - tr
+        i11, i15 = i11 + ti, i11 - ti
+        tr = r20
+        ti = i20
+        r16, r20 = r16 + tr, r16 - tr
+        i16, i20 = i16 + ti, i16 - ti
+        tr = c4 * r21 - s4 * i21
+        ti = c4 * i21 + s4 * r21
+        r17, r21 = r17 + tr, r17 - tr
+        i17, i21 = i17 + ti, i17 - ti
+        tr = i22
+        ti = -r22
+        r18, r22 = r18 + tr, r18 - tr
+        i18, i22 = i18 + ti, i18 - ti
+        tr = c12 * r23 - s12 * i23
+        ti = c12 * i23 + s12 * r23
+        r19, r23 = r19 + tr, r19 - tr
+        i19, i23 = i19 + ti, i19 - ti
+        tr = r28
+        ti = i28
+        r24, r28 = r24 + tr, r24 - tr
+        i24, i28 = i24 + ti, i24 - ti
+        tr = c4 * r29 - s4 * i29
+        ti = c4 * i29 + s4 * r29
+        r25, r29 = r25 + tr, r25 - tr
+        i25, i29 = i25 + ti, i25 - ti
+        tr = i30
+        ti = -r30
+        r26, r30 = r26 + tr, r26 - tr
+        i26, i30 = i26 + ti, i26 - ti
+        tr = c12 * r31 - s12 * i31
+        ti = c12 * i31 + s12 * r31
+        r27, r31 = r27 + tr, r27 - tr
+        i27, i31 = i27 + ti, i27 - ti
+        tr = r8
+        ti = i8
+        r0, r8 = r0 + tr, r0 - tr
+        i0, i8 = i0 + ti, i0 - ti
+        tr = c2 * r9 - s2 * i9
+        ti = c2 * i9 + s2 * r9
+        r1, r9 = r1 + tr, r1 - tr
+        i1, i9 = i1 + ti, i1 - ti
+        tr = c4 * r10 - s4 * i10
+        ti = c4 * i10 + s4 * r10
+        r2, r10 = r2 + tr, r2 - tr
+        i2, i10 = i2 + ti, i2 - ti
+        tr = c6 * r11 - s6 * i11
+        ti = c6 * i11 + s6 * r11
+        r3, r11 = r3 + tr, r3 - tr
+        i3, i11 = i3 + ti, i3 - ti
+        tr = i12
+        ti = -r12
+        r4, r12 = r4 + tr, r4 - tr
+        i4, i12 = i4 + ti, i4 - ti
+        tr = c10 * r13 - s10 * i13
+        ti = c10 * i13 + s10 * r13
+        r5, r13 = r5 + tr, r5 - tr
+        i5, i13 = i5 + ti, i5 - ti
+        tr = c12 * r14 - s12 * i14
+        ti = c12 * i14 + s12 * r14
+        r6, r14 = r6 + tr, r6 - tr
+        i6, i14 = i6 + ti, i6 - ti
+        tr = c14 * r15 - s14 * i15
+        ti = c14 * i15 + s14 * r15
+        r7, r15 = r7 + tr, r7 - tr
+        i7, i15 = i7 + ti, i7 - ti
+        tr = r24
+        ti = i24
+        r16, r24 = r16 + tr, r16 - tr
+        i16, i24 = i16 + ti, i16 - ti
+        tr = c2 * r25 - s2 * i25
+        ti = c2 * i25 + s2 * r25
+        r17, r25 = r17 + tr, r17 - tr
+        i17, i25 = i17 + ti, i17 - ti
+        tr = c4 * r26 - s4 * i26
+        ti = c4 * i26 + s4 * r26
+        r18, r26 = r18 + tr, r18 - tr
+        i18, i26 = i18 + ti, i18 - ti
+        tr = c6 * r27 - s6 * i27
+        ti = c6 * i27 + s6 * r27
+        r19, r27 = r19 + tr, r19 - tr
+        i19, i27 = i19 + ti, i19 - ti
+        tr = i28
+        ti = -r28
+        r20, r28 = r20 + tr, r20 - tr
+        i20, i28 = i20 + ti, i20 - ti
+        tr = c10 * r29 - s10 * i29
+        ti = c10 * i29 + s10 * r29
+        r21, r29 = r21 + tr, r21 - tr
+        i21, i29 = i21 + ti, i21 - ti
+        tr = c12 * r30 - s12 * i30
+        ti = c12 * i30 + s12 * r30
+        r22, r30 = r22 + tr, r22 - tr
+        i22, i30 = i22 + ti, i22 - ti
+        tr = c14 * r31 - s14 * i31
+        ti = c14 * i31 + s14 * r31
+        r23, r31 = r23 + tr, r23 - tr
+        i23, i31 = i23 + ti, i23 - ti
+        tr = r16
+        ti = i16
+        r0, r16 = r0 + tr, r0 - tr
+        i0, i16 = i0 + ti, i0 - ti
+        tr = c1 * r17 - s1 * i17
+        ti = c1 * i17 + s1 * r17
+        r1, r17 = r1 + tr, r1 - tr
+        i1, i17 = i1 + ti, i1 - ti
+        tr = c2 * r18 - s2 * i18
+        ti = c2 * i18 + s2 * r18
+        r2, r18 = r2 + tr, r2 - tr
+        i2, i18 = i2 + ti, i2 - ti
+        tr = c3 * r19 - s3 * i19
+        ti = c3 * i19 + s3 * r19
+        r3, r19 = r3 + tr, r3 - tr
+        i3, i19 = i3 + ti, i3 - ti
+        tr = c4 * r20 - s4 * i20
+        ti = c4 * i20 + s4 * r20
+        r4, r20 = r4 + tr, r4 - tr
+        i4, i20 = i4 + ti, i4 - ti
+        tr = c5 * r21 - s5 * i21
+        ti = c5 * i21 + s5 * r21
+        r5, r21 = r5 + tr, r5 - tr
+        i5, i21 = i5 + ti, i5 - ti
+        tr = c6 * r22 - s6 * i22
+        ti = c6 * i22 + s6 * r22
+        r6, r22 = r6 + tr, r6 - tr
+        i6, i22 = i6 + ti, i6 - ti
+        tr = c7 * r23 - s7 * i23
+        ti = c7 * i23 + s7 * r23
+        r7, r23 = r7 + tr, r7 - tr
+        i7, i23 = i7 + ti, i7 - ti
+        tr = i24
+        ti = -r24
+        r8, r24 = r8 + tr, r8 - tr
+        i8, i24 = i8 + ti, i8 - ti
+        tr = c9 * r25 - s9 * i25
+        ti = c9 * i25 + s9 * r25
+        r9, r25 = r9 + tr, r9 - tr
+        i9, i25 = i9 + ti, i9 - ti
+        tr = c10 * r26 - s10 * i26
+        ti = c10 * i26 + s10 * r26
+        r10, r26 = r10 + tr, r10 - tr
+        i10, i26 = i10 + ti, i10 - ti
+        tr = c11 * r27 - s11 * i27
+        ti = c11 * i27 + s11 * r27
+        r11, r27 = r11 + tr, r11 - tr
+        i11, i27 = i11 + ti, i11 - ti
+        tr = c12 * r28 - s12 * i28
+        ti = c12 * i28 + s12 * r28
+        r12, r28 = r12 + tr, r12 - tr
+        i12, i28 = i12 + ti, i12 - ti
+        tr = c13 * r29 - s13 * i29
+        ti = c13 * i29 + s13 * r29
+        r13, r29 = r13 + tr, r13 - tr
+        i13, i29 = i13 + ti, i13 - ti
+        tr = c14 * r30 - s14 * i30
+        ti = c14 * i30 + s14 * r30
+        r14, r30 = r14 + tr, r14 - tr
+        i14, i30 = i14 + ti, i14 - ti
+        tr = c15 * r31 - s15 * i31
+        ti = c15 * i31 + s15 * r31
+        r15, r31 = r15 + tr, r15 - tr
+        i15, i31 = i15 + ti, i15 - ti
+        fft_abs[p, 0] = np.sqrt(r24 * r24 + i24 * i24)
+        fft_abs[p, 8] = np.sqrt(r0 * r0 + i0 * i0)
+        fft_abs[p, 1] = np.sqrt(r25 * r25 + i25 * i25)
+        fft_abs[p, 9] = np.sqrt(r1 * r1 + i1 * i1)
+        fft_abs[p, 2] = np.sqrt(r26 * r26 + i26 * i26)
+        fft_abs[p, 10] = np.sqrt(r2 * r2 + i2 * i2)
+        fft_abs[p, 3] = np.sqrt(r27 * r27 + i27 * i27)
+        fft_abs[p, 11] = np.sqrt(r3 * r3 + i3 * i3)
+        fft_abs[p, 4] = np.sqrt(r28 * r28 + i28 * i28)
+        fft_abs[p, 12] = np.sqrt(r4 * r4 + i4 * i4)
+        fft_abs[p, 5] = np.sqrt(r29 * r29 + i29 * i29)
+        fft_abs[p, 13] = np.sqrt(r5 * r5 + i5 * i5)
+        fft_abs[p, 6] = np.sqrt(r30 * r30 + i30 * i30)
+        fft_abs[p, 14] = np.sqrt(r6 * r6 + i6 * i6)
+        fft_abs[p, 7] = np.sqrt(r31 * r31 + i31 * i31)
+        fft_abs[p, 15] = np.sqrt(r7 * r7 + i7 * i7)
+    return fft_abs
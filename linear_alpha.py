@@ -1,135 +1,46 @@
 import time
-import struct
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import numpy as np
-from queue import Queue
-from scipy.fftpack import fft, fftshift
+from collections import deque
+from scipy.fft import fft, fftshift
 from numpy.lib.stride_tricks import as_strided
-from scipy.integrate._ivp.radau import P
-
-global cycle
-cycle = 0
-
-
-def DFT(x):
-    """Compute the Discrete Fourier Transform of the 1D array x"""
-    N = len(x)
-    n = np.arange(N)
-    k = n.reshape((N, 1))
-    M = np.exp(-2j * np.pi * k * n / N)
-    return np.dot(M, x)
-
-
-def FFT(x):
-    """A recursive implementation of the 1D Cooley-Tukey FFT"""
-    N = len(x)
-    if N % 2 > 0:
-        raise ValueError("size of x must be a power of 2")
-    elif N <= 2:  # this cutoff should be optimized
-        return DFT(x)
-    else:
-        X_even = FFT(x[::2])
-        X_odd = FFT(x[1::2])
-        factor = np.exp(-2.0j * np.pi * np.arange(N) / N)
-        return np.concatenate([X_even + factor[:N // 2] * X_odd,
-                               X_even + factor[N // 2:] * X_odd])
-
-
-def FFT_vectorized(x):
-    """A vectorized, non-recursive version of the Cooley-Tukey FFT"""
-    N = len(x)
-    if np.log2(N) % 1 > 0:
-        raise ValueError("size of x must be a power of 2")
-    # N_min here is equivalent to the stopping condition above,
-    # and should be a power of 2
-    N_min = min(N, 2)
-    # Perform an O[N^2] DFT on all length-N_min sub-problems at once
-    n = np.arange(N_min)
-    k = n[:, None]
-    M = np.exp(-2j * np.pi * n * k / N_min)
-    X = np.dot(M, np.array(x).reshape((N_min, -1)))
-    # build-up each level of the recursive calculation all at once
-    while X.shape[0] < N:
-        X_even = X[:, :X.shape[1] // 2]
-        X_odd = X[:, X.shape[1] // 2:]
-        factor = np.exp(-1j * np.pi * np.arange(X.shape[0])
-                        / X.shape[0])[:, None]
-        X = np.vstack([X_even + factor * X_odd,
-                       X_even - factor * X_odd])
-
-    return X.ravel()
-
-
-def complex_mult(cell_index, x, y):
-    """Complex multiplication: (X * conjugate(X))"""
-    list_3 = []
-    for i in range(len(x)):
-        real_part = x[i].real * y[i].real - x[i].imag * y[i].imag
-        image_part = x[i].imag * y[i].real + x[i].real * y[i].imag
-        complex_result = real_part + image_part * 1j
-        list_3.append(complex_result)
-        global cycle
-        if cell_index == 0:  # Add for PE[0]
-            cycle += 1
-
-    return list_3
+from pe_kernels import pe_array_kernel  # compiled PE datapath, cached under a stable module name
+from _pe_kernel_32 import pe_array_kernel_32  # unrolled pe_array_kernel, see pe_kernel_generator.py
+
+DTYPE_C = np.complex64  # PE datapath precision
+DTYPE_F = np.float32
+_twiddle_cache = {}
+_ZERO_ALPHA = np.zeros(8, dtype=DTYPE_F)  # prev_alpha seen by PE[0]
 
 
 def getTwiddle(NFFT):
-    """Generate the twiddle factors"""
-    W = np.r_[[1.0 + 1.0j] * NFFT]
-    for k in range(NFFT):
-        W[k] = np.exp(-2.0j * np.pi * k / NFFT)
+    """Generate the twiddle factors (cached per FFT size)"""
+    W = _twiddle_cache.get(NFFT)
+    if W is None:
+        W = np.exp(-2.0j * np.pi * np.arange(NFFT) / NFFT)
+        _twiddle_cache[NFFT] = W
 
     return W
 
 
-def rFFT(cell_index, x):
-    """
-    Recursive FFT implementation.
-    References
-      -- http://www.cse.uiuc.edu/iem/fft/rcrsvfft/
-      -- "A Simple and Efficient FFT Implementation in C++"
-          by Vlodymyr Myrnyy
-    """
-    n = len(x)
-    if n == 1:
-        return x
-    w = getTwiddle(n)
-    m = n // 2
-    X = np.ones(m, float) * 1j
-    Y = np.ones(m, float) * 1j
-    for k in range(m):
-        X[k] = x[2 * k]
-        Y[k] = x[2 * k + 1]
-    X = rFFT(cell_index, X)
-    Y = rFFT(cell_index, Y)
-    F = np.ones(n, float) * 1j
-    for k in range(n):
-        i = (k % m)
-        F[k] = X[i] + w[k] * Y[i]
-        global cycle
-        if cell_index == 0:  # Add for PE[0]
-            cycle += 1
-
-    return F
-
-
 class LinearArrayCell:
     def __init__(self, cell_size):
         self.cell_size = cell_size
         self.cell_index = 0
         self.cell_input = None
-        self.single_in = 0
-        self.single_out = 0
-        self.data_to_compute_1 = Queue(maxsize=self.cell_size)
-        self.data_to_compute_2 = Queue(maxsize=self.cell_size)
-        self.alpha = [0] * 8
+        self.data_to_compute_1 = np.zeros((2, self.cell_size), dtype=DTYPE_F)  # [real; imag]
+        self.data_to_compute_2 = np.zeros((2, self.cell_size), dtype=DTYPE_F)
+        self.alpha = np.zeros(8, dtype=DTYPE_F)
         self.alpha_top = []
         self.alpha_bottom = []
-        self.cell_shift = Queue()
-        self.cell_partial_result = Queue()
-        self.cell_output = Queue()
+        self.cell_shift = deque()
+        self.cell_partial_result = deque()
+        self.cell_output = deque()
         self.signal_index = 0
+        self.cycle = 0
+        # X * conjugate(Y) + radix-2 FFT + |.| of the 16 centre bins, per compute
+        self.compute_cycle = self.cell_size + self.cell_size * int(np.log2(self.cell_size)) + 16
 
     def connect(self, cell_index, array, array_size, iterations):
         self.cell_index = cell_index
@@ -142,80 +53,50 @@ class LinearArrayCell:
             self.cell_input = array.cells[self.cell_index - 1]  # shift registers
 
     def cell_read(self):  # load all data needed for a cell
-        # global cycle
-        if type(self.cell_input) is Queue:  # from input FIFO
-            for _ in range(self.cell_size):
-                if self.cell_input.empty():
-                    self.single_in = 0
-                else:
-                    self.single_in = self.cell_input.get()
-                self.data_to_compute_1.put(self.single_in)
-                self.data_to_compute_2.put(self.single_in.real - self.single_in.imag * 1j)  # conjugate
-                # cycle += 1
+        if type(self.cell_input) is np.ndarray:  # from input FIFO (zero-padded when it is short)
+            samples = np.zeros(self.cell_size, dtype=DTYPE_C)
+            samples[:len(self.cell_input)] = self.cell_input[:self.cell_size]
+            self.data_to_compute_1 = np.vstack((samples.real, samples.imag))
+            self.data_to_compute_2 = self.data_to_compute_1  # conjugated in pe_kernel
         else:  # from shift registers (only for data, not for conjugate(data))
-            for _ in range(self.cell_size):
-                self.single_in = self.cell_input.cell_shift.get()
-                self.data_to_compute_1.put(self.single_in)
-                # self.data_to_compute_2.put(self.single_in.real - self.single_in.imag * 1j)
-                # cycle += 1
-
-    def compute(self, cell_index, last_cell, prev_alpha, iterations):
-        global cycle
-        list_1 = list(self.data_to_compute_1.queue)
-        list_2 = list(self.data_to_compute_2.queue)
-        cm = complex_mult(cell_index, list_1, list_2)
-        fft_res = rFFT(cell_index, cm)
-        # print(f'Compare rFFT with built-in FFT at PE {iterations}:', np.allclose(rFFT(cm), fft(cm)))
-        fft_shift = fftshift(fft_res)[len(fft_res) // 2 - 8: len(fft_res) // 2 + 8]  # fft_res[8:23]
-        fft_abs = np.abs(fft_shift)
-        if cell_index == 0:  # Add for PE[0]
-            cycle += 16
+            self.data_to_compute_1 = self.cell_input.cell_shift.popleft()
+
+    def compute(self, fft_abs, last_cell, prev_alpha, iterations):  # fft_abs: this cell's row of pe_array_kernel
+        self.cycle += self.compute_cycle
+        half = len(fft_abs) >> 1
         if iterations == 0:
-            self.alpha_top = fft_abs[len(fft_abs) // 2: len(fft_abs)]  # previous top: fft_abs[8:15]
+            self.alpha_top = fft_abs[half:]  # previous top: fft_abs[8:15]
         else:  # iteration 1 to N-1
             if not last_cell:
                 # self.alpha = self.alpha_top  # initialize alpha with previous top: fft_abs[8:15]
-                self.alpha_bottom = fft_abs[0: len(fft_abs) // 2]  # current bottom: fft_abs[0:7]
-                for i in range(len(fft_abs) // 2):
-                    # alpha = max(top of (k-1) iteration, bottom of k iteration, alpha of previous PE) #
-                    if self.alpha_top[i] < self.alpha_bottom[i]:
-                        self.alpha[i] = self.alpha_bottom[i]  # update alpha
-                    else:
-                        self.alpha[i] = self.alpha_top[i]  # update alpha
-                    if self.alpha[i] < prev_alpha[i]:
-                        self.alpha[i] = prev_alpha[i]  # update alpha
-                    if cell_index == 0:  # Add for PE[0]
-                        cycle += 2
-                self.alpha_top = fft_abs[len(fft_abs) // 2: len(fft_abs)]  # update alpha_top to current iteration
+                self.alpha_bottom = fft_abs[:half]  # current bottom: fft_abs[0:7]
+                # alpha = max(top of (k-1) iteration, bottom of k iteration, alpha of previous PE) #
+                self.alpha = np.maximum(np.maximum(self.alpha_top, self.alpha_bottom), prev_alpha)  # update alpha
+                self.cycle += 2 * half
+                self.alpha_top = fft_abs[half:]  # update alpha_top to current iteration
             else:  # last PE in each iteration
-                for i in range(len(fft_abs) // 2):
-                    if self.alpha_top[i] < prev_alpha[i]:  # top of previous iteration Vs. alpha of previous PE
-                        self.alpha[i] = prev_alpha[i]
-                    else:
-                        self.alpha[i] = self.alpha_top[i]
-                    if cell_index == 0:  # Add for PE[0]
-                        cycle += 1
+                # top of previous iteration Vs. alpha of previous PE
+                self.alpha = np.maximum(self.alpha_top, prev_alpha)
+                self.cycle += half
                 # self.alpha = self.alpha_top  # final output: alpha
 
-    def shift(self):
-        # global cycle
-        for _ in range(self.cell_size):
-            self.single_out = self.data_to_compute_1.get()
-            self.cell_shift.put(self.single_out)
-            # cycle += 1
+    def shift(self):  # pass the whole register block on to the next cell
+        self.cell_shift.append(self.data_to_compute_1)
 
     def clear_shift(self):  # to clear shift data from cell_shift queue when complete an input signal
-        for _ in range(self.cell_size):
-            self.cell_shift.get()
-            self.data_to_compute_2.get()
+        self.cell_shift.popleft()
 
 
 class LinearArray:
     def __init__(self, array_size, cell_size, fifo_input):
+        if cell_size < 16 or cell_size & (cell_size - 1):  # radix-2 FFT, 16 centre bins read without bounds checks
+            raise ValueError("cell_size must be a power of 2 and at least 16")
         self.array_size = array_size
         self.cell_size = cell_size
         self.input = fifo_input
         self.iterations = 0
+        self.cycle = 0  # cycles spent on PE[0]
+        self.twiddle = getTwiddle(self.cell_size).astype(DTYPE_C)
         self.cells = []
         self.result = []
 
@@ -233,14 +114,23 @@ class LinearArray:
             cell.cell_read()
 
     def compute(self):
+        if self.num_cells <= 0:  # every PE has already produced its alpha
+            return
+        active = self.cells[:self.num_cells]
+        x = np.stack([cell.data_to_compute_1 for cell in active])
+        y = np.stack([cell.data_to_compute_2 for cell in active])
+        if self.cell_size == 32:
+            fft_abs = pe_array_kernel_32(x, y)
+        else:
+            fft_abs = pe_array_kernel(x, y, self.twiddle)
         last_cell = False
         for i in range(self.num_cells):
             if i == self.num_cells - 1:
                 last_cell = True
             if i == 0:  # cell 0: prev_alpha = [0, 0, 0, 0, 0, 0, 0, 0]
-                self.cells[i].compute(i, last_cell, [0 for _ in range(8)], self.iterations)
+                self.cells[i].compute(fft_abs[i], last_cell, _ZERO_ALPHA, self.iterations)
             else:  # cell i: prev_alpha = cells[i-1].alpha
-                self.cells[i].compute(i, last_cell, self.cells[i - 1].alpha, self.iterations)
+                self.cells[i].compute(fft_abs[i], last_cell, self.cells[i - 1].alpha, self.iterations)
         if self.iterations > 0:
             self.num_cells -= 1
 
@@ -252,11 +142,11 @@ class LinearArray:
         for _ in range(total_iterations):
             self.connect()
             self.read()
-            global cycle
-            cycle += 32
+            self.cycle += 32  # input read (fixed 32 cycles, as in the original model)
             self.compute()
             self.shift()
             self.iterations += 1
+        self.cycle += self.cells[0].cycle
         self.result.append(self.cells[0].alpha_top)  # output alpha_top of PE[0]
         self.cells.pop(0)
         for cell in self.cells:
@@ -264,6 +154,14 @@ class LinearArray:
         return self.result
 
 
+def run_signal(array_size, cell_size, signal_input):
+    """Run one signal through its own LinearArray, returns (alpha profile, cycles on PE)"""
+    array = LinearArray(array_size, cell_size, [signal_input])
+    scd = array.run(array_size)
+
+    return scd, array.cycle
+
+
 def sliding_window(x, w, s):
     shape = (((x.shape[0] - w) // s + 1), w)
     strides = (x.strides[0] * s, x.strides[0])
@@ -301,8 +199,6 @@ def main():
     signals = 1
     pes = 8  # 256, 16, 8
     registers = 32  # 32, 32, 32
-    total_iter = signals * pes
-    input_queue = [[Queue() for _ in range(pes)] for _ in range(signals)]
     input_cycle = registers  # * pes
     compute_cycle = registers + registers * np.log2(registers) + registers / 2 + registers / 2
     shift_cycle = registers
@@ -379,31 +275,20 @@ def main():
     np.savetxt("data/array_input_hex.txt", XD_hex_xy, fmt="%s")  # save to text for FPGA process
     # np.savetxt("data/array_y_hex.txt", XD_hex_conj, fmt="%s")  # save to text for FPGA process
     # Use the down conversion results as the inputs of PE arrays
-    for signal in range(signals):
-        for pe in range(pes):
-            for register in range(registers):
-                pe_input = XD[pe][register]
-                input_queue[signal][pe].put(pe_input)
-    '''    
-    for signal in range(signals):
-        for pe in range(pes):
-            if signal == 0:
-                for index in range(pe * registers, (pe + 1) * registers):
-                    complex_data = index / 256  # + (index + 1) / 256 * 1j
-                    input_queue[signal][pe].put(complex_data)
-            if signal > 0:
-                for index in reversed(range(pe * registers, (pe + 1) * registers)):
-                    complex_data = index / 256 + (index + 1) / 256 * 1j
-                    input_queue[signal][pe].put(complex_data)
+    input_queue = [XD] * signals  # row pe of XD is the input FIFO of PE[pe]
+    '''
+    index = np.arange(pes * registers).reshape(pes, registers)
+    input_queue = [index / 256 if signal == 0  # + (index + 1) / 256 * 1j
+                   else index[:, ::-1] / 256 + (index[:, ::-1] + 1) / 256 * 1j for signal in range(signals)]
     '''
-    # print(list(input_queue[0][-1].queue))
-    myArray = LinearArray(pes, registers, input_queue)
+    # print(list(input_queue[0][-1]))
     start_time = time.time()
-    scd = myArray.run(total_iter)  # run (signal*pes) times
+    with ThreadPoolExecutor(max_workers=signals) as pool:  # one LinearArray per signal, run pes times each
+        runs = list(pool.map(partial(run_signal, pes, registers), input_queue))
     end_time = time.time()
     cpu_time = end_time - start_time
-    # pe_cycle = cycle // pes
-    pe_cycle = cycle
+    scd = [alpha for signal_scd, _ in runs for alpha in signal_scd]
+    pe_cycle = sum(signal_cycle for _, signal_cycle in runs)
     print('----{:.4f} seconds on CPU----'.format(cpu_time))
     print('Real total number of cycles on PE = {}'.format(pe_cycle))
     # print('----alpha profile of SCD matrix----')
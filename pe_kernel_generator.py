@@ -0,0 +1,56 @@
+import sys
+import numpy as np
+
+
+def pe_array_kernel_source(n):
+    """
+    Source of pe_array_kernel specialised for n registers.
+    The radix-2 butterflies are unrolled into straight-line code on scalar locals,
+    with the twiddles baked in as float32 constants (trivial ones are folded away).
+    """
+    bits = n.bit_length() - 1
+    consts = []
+    src = ['def pe_array_kernel_{:d}(x, y):'.format(n),
+           '    fft_abs = np.empty((x.shape[0], 16), np.float32)',
+           '    for p in range(x.shape[0]):']
+    for k in range(n):  # X * conjugate(Y), loaded in bit-reversed order
+        j = int(format(k, '0{:d}b'.format(bits))[::-1], 2)
+        src.append('        r{0} = x[p, 0, {1}] * y[p, 0, {1}] + x[p, 1, {1}] * y[p, 1, {1}]'.format(j, k))
+        src.append('        i{0} = x[p, 1, {1}] * y[p, 0, {1}] - x[p, 0, {1}] * y[p, 1, {1}]'.format(j, k))
+    size = 2
+    while size <= n:
+        half = size // 2
+        for start in range(0, n, size):
+            for k in range(half):
+                a, b, t = start + k, start + k + half, k * (n // size)
+                if t == 0:  # w = 1
+                    src.append('        tr = r{0}\n        ti = i{0}'.format(b))
+                elif 4 * t == n:  # w = -1j
+                    src.append('        tr = i{0}\n        ti = -r{0}'.format(b))
+                else:
+                    if size == n:  # the last stage uses every non-trivial twiddle once
+                        consts.append('c{0} = np.float32({1!r})'.format(t, float(np.float32(np.cos(2 * np.pi * t / n)))))
+                        consts.append('s{0} = np.float32({1!r})'.format(t, float(np.float32(-np.sin(2 * np.pi * t / n)))))
+                    src.append('        tr = c{0} * r{1} - s{0} * i{1}\n        ti = c{0} * i{1} + s{0} * r{1}'.format(t, b))
+                src.append('        r{0}, r{1} = r{0} + tr, r{0} - tr\n        i{0}, i{1} = i{0} + ti, i{0} - ti'.format(a, b))
+        size *= 2
+    for k in range(8):  # |.| of the 16 centre bins: fftshift(F)[n // 2 - 8: n // 2 + 8]
+        src.append('        fft_abs[p, {0}] = np.sqrt(r{1} * r{1} + i{1} * i{1})'.format(k, n - 8 + k))
+        src.append('        fft_abs[p, {0}] = np.sqrt(r{1} * r{1} + i{1} * i{1})'.format(k + 8, k))
+    src.append('    return fft_abs')
+    header = ['# Generated by "python pe_kernel_generator.py {:d}", do not edit.'.format(n),
+              'import numpy as np',
+              'from numba import njit', '']
+    decorator = ["@njit('float32[:, ::1](float32[:, :, ::1], float32[:, :, ::1])', cache=True, fastmath=True, nogil=True)"]
+
+    return '\n'.join(header + consts + ['', ''] + decorator + src) + '\n'
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 32  # registers
+    with open('_pe_kernel_{:d}.py'.format(n), 'w') as f:
+        f.write(pe_array_kernel_source(n))
+
+
+if __name__ == "__main__":
+    main()